@@ -3,7 +3,6 @@ from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, cast
 
 from app.database import get_db
 from app.dependencies.auth import get_current_user
@@ -11,8 +10,6 @@ from app.models.user import User
 from app.services.geospatial_service import GeospatialService
 from app.schemas.recommendation import EventRecommendation, RecommendationsResponse
 from app.repositories.user_repository import UserRepository
-import geoalchemy2
-from geoalchemy2 import functions as geo_func
 
 
 router = APIRouter(prefix="/for-you", tags=["recommendations"])
@@ -73,22 +70,6 @@ async def get_recommendations(
                 detail="User has no location set. Please update user location first.",
             )
 
-        # Extract user coordinates from Geography type
-        # Cast Geography to Geometry to use ST_Y and ST_X functions
-        coords_result = await db.execute(
-            select(
-                geo_func.ST_Y(cast(user.location, geoalchemy2.Geometry)).label("lat"),
-                geo_func.ST_X(cast(user.location, geoalchemy2.Geometry)).label("lng"),
-            )
-        )
-        coords = coords_result.first()
-
-        if not coords:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Could not extract user location coordinates",
-            )
-
         # Get recommendations
         service = GeospatialService(db)
         recommendations = await service.get_recommendations_for_user(
@@ -113,8 +94,8 @@ async def get_recommendations(
         return RecommendationsResponse(
             recommendations=recommendation_items,
             total=len(recommendation_items),
-            user_latitude=float(coords.lat),
-            user_longitude=float(coords.lng),
+            user_latitude=user.latitude,
+            user_longitude=user.longitude,
             radius_km=radius_km,
         )
 
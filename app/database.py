@@ -1,4 +1,5 @@
 """Database configuration and session management."""
+import asyncio
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -15,8 +16,9 @@ engine = create_async_engine(
     echo=settings.DATABASE_ECHO,
     future=True,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
 
 # Create async session factory
@@ -65,6 +67,33 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_up_pool() -> None:
+    """
+    Open pool_size connections up front so early requests skip the handshake.
+
+    The connections are opened concurrently and returned straight to the pool,
+    which keeps them for reuse. Startup waits at most DB_POOL_WARMUP_TIMEOUT
+    seconds; connects still pending then are cancelled. Connection failures are
+    not raised here; the pool simply falls back to connecting on demand.
+    """
+    tasks = [
+        asyncio.ensure_future(engine.connect().start())
+        for _ in range(settings.DB_POOL_SIZE)
+    ]
+    if not tasks:
+        return
+
+    _, pending = await asyncio.wait(tasks, timeout=settings.DB_POOL_WARMUP_TIMEOUT)
+    for task in pending:
+        task.cancel()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.gather(
+        *(conn.close() for conn in results if not isinstance(conn, BaseException)),
+        return_exceptions=True,
+    )
+
+
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
@@ -2,12 +2,12 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import init_db, close_db, get_db
+from app.database import init_db, close_db, get_db, warm_up_pool
 from app.api import events, tickets, users, recommendations, auth
 
 
@@ -23,6 +23,7 @@ async def lifespan(app: FastAPI):
     # Note: Database tables should be created via Alembic migrations
     # init_db() is only for development/testing
     # await init_db()
+    await warm_up_pool()
     yield
     # Shutdown
     await close_db()
@@ -37,6 +38,7 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -105,7 +105,12 @@ class Ticket(Base):
 
     @property
     def is_expired(self) -> bool:
-        """Check if ticket has expired."""
+        """
+        Check if ticket has expired, on the application clock.
+
+        For display only; payment and expiry decisions compare expires_at
+        against the database clock that stamped it.
+        """
         if self.status != TicketStatus.RESERVED or not self.expires_at:
             return False
         return datetime.now(timezone.utc) > self.expires_at
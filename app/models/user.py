@@ -3,10 +3,11 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, cast
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from geoalchemy2 import Geography
+from sqlalchemy.orm import Mapped, mapped_column, relationship, column_property
+from geoalchemy2 import Geography, Geometry
+from geoalchemy2 import functions as geo_func
 
 from app.database import Base
 
@@ -41,6 +42,15 @@ class User(Base):
         nullable=True,
     )
 
+    # Coordinates extracted from location in the same SELECT that loads the user
+    # Cast Geography to Geometry to use ST_Y and ST_X functions
+    latitude: Mapped[float | None] = column_property(
+        geo_func.ST_Y(cast(location, Geometry))
+    )
+    longitude: Mapped[float | None] = column_property(
+        geo_func.ST_X(cast(location, Geometry))
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
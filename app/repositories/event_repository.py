@@ -2,7 +2,7 @@
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime, timezone
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from geoalchemy2.elements import WKTElement
 
@@ -83,6 +83,49 @@ class EventRepository:
         await self.db.refresh(event)
         return event
 
+    async def bulk_create(self, events_data: List[dict]) -> List[Event]:
+        """
+        Create several events with a single flush.
+
+        Args:
+            events_data: One dict per event with the same keyword arguments
+                as create()
+
+        Returns:
+            List of created Event objects, not refreshed. IDs, timestamps and
+            tickets_sold come from Python-side defaults and are set by the
+            flush; location still holds the WKT it was built from. Callers
+            must await session.refresh() before reading anything the database
+            computes, since an unloaded attribute raises MissingGreenlet under
+            AsyncSession instead of lazy-loading.
+        """
+        events = [Event(**self._event_row(data)) for data in events_data]
+
+        self.db.add_all(events)
+        await self.db.flush()
+        return events
+
+    async def bulk_insert(self, events_data: List[dict]) -> None:
+        """
+        Insert several events with one executemany INSERT.
+
+        Skips the unit of work entirely, so nothing is added to the session;
+        use it when the created Event objects are not needed afterwards.
+
+        Args:
+            events_data: One dict per event with the same keyword arguments
+                as create(); every dict must have the same keys
+        """
+        await self.db.execute(insert(Event), [self._event_row(data) for data in events_data])
+
+    @staticmethod
+    def _event_row(data: dict) -> dict:
+        """Map create() keyword arguments onto Event column values."""
+        row = {k: v for k, v in data.items() if k not in ("latitude", "longitude")}
+        row["location"] = WKTElement(f"POINT({data['longitude']} {data['latitude']})", srid=4326)
+        row["tickets_sold"] = 0
+        return row
+
     async def get_by_id(self, event_id: UUID) -> Optional[Event]:
         """
         Get event by ID.
@@ -181,7 +224,7 @@ class EventRepository:
         await self.db.flush()
         return True
 
-    async def increment_tickets_sold(self, event_id: UUID, amount: int = 1) -> bool:
+    async def increment_tickets_sold(self, event_id: UUID, amount: int = 1) -> Optional[int]:
         """
         Increment tickets_sold counter atomically.
 
@@ -190,17 +233,17 @@ class EventRepository:
             amount: Amount to increment by (default: 1)
 
         Returns:
-            True if successful, False if event not found
+            New tickets_sold value, or None if event not found
         """
-        event = await self.get_by_id(event_id)
-        if not event:
-            return False
-
-        event.tickets_sold += amount
-        await self.db.flush()
-        return True
+        result = await self.db.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(tickets_sold=Event.tickets_sold + amount)
+            .returning(Event.tickets_sold)
+        )
+        return result.scalar_one_or_none()
 
-    async def decrement_tickets_sold(self, event_id: UUID, amount: int = 1) -> bool:
+    async def decrement_tickets_sold(self, event_id: UUID, amount: int = 1) -> Optional[int]:
         """
         Decrement tickets_sold counter atomically.
 
@@ -209,13 +252,13 @@ class EventRepository:
             amount: Amount to decrement by (default: 1)
 
         Returns:
-            True if successful, False if event not found
+            New tickets_sold value, or None if event not found
         """
-        event = await self.get_by_id(event_id)
-        if not event:
-            return False
-
         # Ensure we don't go below 0
-        event.tickets_sold = max(0, event.tickets_sold - amount)
-        await self.db.flush()
-        return True
+        result = await self.db.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(tickets_sold=func.greatest(Event.tickets_sold - amount, 0))
+            .returning(Event.tickets_sold)
+        )
+        return result.scalar_one_or_none()
@@ -1,8 +1,8 @@
 """Ticket repository for database operations."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
-from datetime import datetime, timezone
-from sqlalchemy import select
+from datetime import datetime, timedelta
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -22,6 +22,7 @@ class TicketRepository:
         event_id: UUID,
         status: TicketStatus = TicketStatus.RESERVED,
         expires_at: Optional[datetime] = None,
+        expires_in_seconds: Optional[int] = None,
         expiration_task_id: Optional[str] = None,
     ) -> Ticket:
         """
@@ -32,11 +33,19 @@ class TicketRepository:
             event_id: Event UUID
             status: Ticket status (default: RESERVED)
             expires_at: Expiration timestamp (optional)
+            expires_in_seconds: Expire this many seconds after the database's
+                statement_timestamp() (optional, takes precedence over expires_at)
             expiration_task_id: Celery task ID for expiration (optional)
 
         Returns:
             Created Ticket object
         """
+        if expires_in_seconds is not None:
+            # Computed inside the INSERT so the database clock is authoritative.
+            # statement_timestamp() rather than now(): now() is the transaction
+            # start, so a wait on the event row lock would shorten the reservation.
+            expires_at = func.statement_timestamp() + timedelta(seconds=expires_in_seconds)
+
         ticket = Ticket(
             user_id=user_id,
             event_id=event_id,
@@ -87,6 +96,32 @@ class TicketRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_by_id_for_update_with_expiry(
+        self, ticket_id: UUID
+    ) -> Optional[Tuple[Ticket, bool]]:
+        """
+        Get ticket by ID with row lock, plus whether it has expired.
+
+        Expiry is decided on the database clock (the one that stamped
+        expires_at), not the application's.
+
+        Args:
+            ticket_id: Ticket UUID
+
+        Returns:
+            Tuple of (Ticket, expired) or None if not found
+        """
+        result = await self.db.execute(
+            select(Ticket, (Ticket.expires_at < func.statement_timestamp()).label("expired"))
+            .where(Ticket.id == ticket_id)
+            .with_for_update()
+        )
+        row = result.one_or_none()
+        if not row:
+            return None
+        # expires_at IS NULL compares as NULL: the ticket never expires
+        return row.Ticket, bool(row.expired)
+
     async def get_by_user(
         self,
         user_id: UUID,
@@ -193,12 +228,11 @@ class TicketRepository:
         Returns:
             List of expired Ticket objects
         """
-        now = datetime.now(timezone.utc)
         result = await self.db.execute(
             select(Ticket)
             .where(Ticket.status == TicketStatus.RESERVED)
             .where(Ticket.expires_at != None)
-            .where(Ticket.expires_at < now)
+            .where(Ticket.expires_at < func.now())
             .limit(limit)
         )
         return list(result.scalars().all())
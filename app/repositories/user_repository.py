@@ -1,11 +1,9 @@
 """User repository for database operations."""
 from typing import Optional, List
 from uuid import UUID
-from sqlalchemy import select, cast
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from geoalchemy2.elements import WKTElement
-import geoalchemy2
-from geoalchemy2 import functions as geo_func
 
 from app.models.user import User
 from app.schemas.user import UserResponse
@@ -165,29 +163,12 @@ class UserRepository:
         Returns:
             UserResponse schema
         """
-        latitude = None
-        longitude = None
-
-        if user.location:
-            # Extract coordinates from Geography Point
-            # Cast Geography to Geometry to use ST_Y and ST_X functions
-            coords_result = await self.db.execute(
-                select(
-                    geo_func.ST_Y(cast(user.location, geoalchemy2.Geometry)).label("lat"),
-                    geo_func.ST_X(cast(user.location, geoalchemy2.Geometry)).label("lng"),
-                )
-            )
-            coords = coords_result.first()
-            if coords:
-                latitude = float(coords.lat)
-                longitude = float(coords.lng)
-
         return UserResponse(
             id=user.id,
             name=user.name,
             email=user.email,
-            latitude=latitude,
-            longitude=longitude,
+            latitude=user.latitude,
+            longitude=user.longitude,
             created_at=user.created_at,
             updated_at=user.updated_at,
         )
@@ -1,8 +1,9 @@
 """Pydantic schemas for Event endpoints."""
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, computed_field, field_validator, model_validator
 from typing_extensions import Self
 
 
@@ -19,15 +20,8 @@ class VenueSchema(BaseModel):
     country: str = Field(..., min_length=1, max_length=100)
     postal_code: str = Field(..., min_length=1, max_length=20)
 
-    @field_validator("latitude", "longitude")
-    @classmethod
-    def validate_coordinates(cls, v: float, info) -> float:
-        """Validate that coordinates are valid numbers."""
-        if not isinstance(v, (int, float)):
-            raise ValueError(f"{info.field_name} must be a number")
-        return v
-
-    model_config = {"from_attributes": True}
+    # Immutable so one validated venue can be shared between events
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class EventCreate(BaseModel):
@@ -63,7 +57,7 @@ class EventCreate(BaseModel):
             raise ValueError("start_time must be in the future")
         return self
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class EventResponse(BaseModel):
@@ -77,8 +71,6 @@ class EventResponse(BaseModel):
     end_time: datetime
     total_tickets: int
     tickets_sold: int
-    tickets_available: int
-    is_sold_out: bool
 
     # Venue information
     latitude: float
@@ -96,6 +88,18 @@ class EventResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @computed_field
+    @cached_property
+    def tickets_available(self) -> int:
+        """Number of tickets still available, derived once per instance."""
+        return self.total_tickets - self.tickets_sold
+
+    @computed_field
+    @cached_property
+    def is_sold_out(self) -> bool:
+        """Whether all tickets have been sold, derived once per instance."""
+        return self.tickets_sold >= self.total_tickets
+
     @classmethod
     def from_orm_model(cls, event) -> "EventResponse":
         """Create response from ORM model."""
@@ -109,8 +113,6 @@ class EventResponse(BaseModel):
             end_time=event.end_time,
             total_tickets=event.total_tickets,
             tickets_sold=event.tickets_sold,
-            tickets_available=event.tickets_available,
-            is_sold_out=event.is_sold_out,
             latitude=0.0,  # Will be populated from location
             longitude=0.0,  # Will be populated from location
             venue_name=event.venue_name,
@@ -34,32 +34,66 @@ class EventService:
         Raises:
             ValueError: If validation fails
         """
-        # Ensure times are in UTC
-        start_time_utc = event_data.start_time
-        end_time_utc = event_data.end_time
-
         # Create event
-        event = await self.repository.create(
-            creator_id=creator_id,
-            title=event_data.title,
-            description=event_data.description,
-            start_time=start_time_utc,
-            end_time=end_time_utc,
-            total_tickets=event_data.total_tickets,
-            latitude=event_data.venue.latitude,
-            longitude=event_data.venue.longitude,
-            venue_name=event_data.venue.venue_name,
-            address_line1=event_data.venue.address_line1,
-            address_line2=event_data.venue.address_line2,
-            city=event_data.venue.city,
-            state=event_data.venue.state,
-            country=event_data.venue.country,
-            postal_code=event_data.venue.postal_code,
-        )
+        event = await self.repository.create(**self._event_fields(creator_id, event_data))
 
         await self.db.commit()
         return await self._event_to_response(event, event_data.venue.latitude, event_data.venue.longitude)
 
+    async def bulk_create_events(
+        self, creator_id: UUID, events_data: List[EventCreate]
+    ) -> List[EventResponse]:
+        """
+        Create several events with a single flush and commit.
+
+        Args:
+            creator_id: User ID of the event creator
+            events_data: Event creation data, one entry per event
+
+        Returns:
+            Created event responses, in input order
+        """
+        events = await self.repository.bulk_create(
+            [self._event_fields(creator_id, event_data) for event_data in events_data]
+        )
+
+        await self.db.commit()
+        return [
+            await self._event_to_response(event, event_data.venue.latitude, event_data.venue.longitude)
+            for event, event_data in zip(events, events_data)
+        ]
+
+    @staticmethod
+    def _event_fields(creator_id: UUID, event_data: EventCreate) -> dict:
+        """
+        Flatten EventCreate into EventRepository.create() keyword arguments.
+
+        Args:
+            creator_id: User ID of the event creator
+            event_data: Event creation data
+
+        Returns:
+            Keyword arguments for the repository
+        """
+        venue = event_data.venue
+        return {
+            "creator_id": creator_id,
+            "title": event_data.title,
+            "description": event_data.description,
+            "start_time": event_data.start_time,
+            "end_time": event_data.end_time,
+            "total_tickets": event_data.total_tickets,
+            "latitude": venue.latitude,
+            "longitude": venue.longitude,
+            "venue_name": venue.venue_name,
+            "address_line1": venue.address_line1,
+            "address_line2": venue.address_line2,
+            "city": venue.city,
+            "state": venue.state,
+            "country": venue.country,
+            "postal_code": venue.postal_code,
+        }
+
     async def get_event_by_id(self, event_id: UUID) -> Optional[EventResponse]:
         """
         Get event by ID.
@@ -222,8 +256,6 @@ class EventService:
             end_time=event.end_time,
             total_tickets=event.total_tickets,
             tickets_sold=event.tickets_sold,
-            tickets_available=event.tickets_available,
-            is_sold_out=event.is_sold_out,
             latitude=latitude,
             longitude=longitude,
             venue_name=event.venue_name,
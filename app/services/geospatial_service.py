@@ -2,11 +2,10 @@
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime, timezone
-from sqlalchemy import select, func, cast
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from geoalchemy2 import functions as geo_func
 from geoalchemy2.types import Geography
-import geoalchemy2
 
 from app.models.event import Event
 from app.models.user import User
@@ -107,7 +106,7 @@ class GeospatialService:
         Returns:
             List of event recommendations with distance
         """
-        # Get user
+        # Get user (latitude/longitude are loaded in the same SELECT)
         user_result = await self.db.execute(
             select(User).where(User.id == user_id)
         )
@@ -116,23 +115,10 @@ class GeospatialService:
         if not user or not user.location:
             return []
 
-        # Extract user coordinates
-        # Cast Geography to Geometry to use ST_Y and ST_X functions
-        coords_result = await self.db.execute(
-            select(
-                geo_func.ST_Y(cast(user.location, geoalchemy2.Geometry)).label("lat"),
-                geo_func.ST_X(cast(user.location, geoalchemy2.Geometry)).label("lng"),
-            )
-        )
-        coords = coords_result.first()
-
-        if not coords:
-            return []
-
         # Find nearby events
         nearby_events = await self.find_nearby_events(
-            latitude=float(coords.lat),
-            longitude=float(coords.lng),
+            latitude=user.latitude,
+            longitude=user.longitude,
             radius_km=radius_km,
             skip=skip,
             limit=limit,
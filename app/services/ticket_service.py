@@ -1,25 +1,29 @@
 """Ticket service layer for business logic."""
+import logging
 from typing import Optional, List
 from uuid import UUID
-from datetime import datetime, timedelta, timezone
-from sqlalchemy import select
+from datetime import datetime, timezone
+from sqlalchemy import select, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.ticket_repository import TicketRepository
 from app.repositories.event_repository import EventRepository
-from app.repositories.user_repository import UserRepository
 from app.schemas.ticket import TicketReserve, TicketResponse, TicketListItem, TicketListResponse
 from app.models.ticket import Ticket, TicketStatus
 from app.models.event import Event
+from app.models.user import User
 from app.config import settings
 
 # Import Celery tasks
 try:
-    from app.tasks.ticket_tasks import expire_ticket_task, cancel_expiration_task
+    from kombu.exceptions import OperationalError as BrokerOperationalError
+    from app.tasks.ticket_tasks import expire_ticket_task, revoke_expiration_task
     CELERY_AVAILABLE = True
 except ImportError:
     CELERY_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class TicketNotFoundException(Exception):
     """Exception raised when ticket is not found."""
@@ -65,7 +69,6 @@ class TicketService:
         self.db = db
         self.ticket_repo = TicketRepository(db)
         self.event_repo = EventRepository(db)
-        self.user_repo = UserRepository(db)
 
     async def reserve_ticket(self, user_id: UUID, reservation_data: TicketReserve) -> TicketResponse:
         """
@@ -75,7 +78,7 @@ class TicketService:
         to prevent overselling (race conditions).
 
         Flow:
-        1. Lock event row (SELECT FOR UPDATE)
+        1. Lock event row (SELECT FOR UPDATE) and check user exists in one round trip
         2. Check event exists
         3. Check user exists
         4. Check tickets available (tickets_sold < total_tickets)
@@ -97,23 +100,27 @@ class TicketService:
             EventSoldOutException: If no tickets available
         """
         # Step 1: Get and lock event row (SELECT FOR UPDATE)
-        # This prevents other concurrent reservations from reading stale data
+        # This prevents other concurrent reservations from reading stale data.
+        # The user existence check rides along as an EXISTS subquery so both
+        # lookups cost a single round trip (an AsyncSession cannot run two
+        # statements concurrently).
+        user_exists = exists().where(User.id == user_id)
         result = await self.db.execute(
-            select(Event)
+            select(Event, user_exists.label("user_exists"))
             .where(Event.id == reservation_data.event_id)
-            .with_for_update()
+            .with_for_update(of=Event)
         )
-        event = result.scalar_one_or_none()
+        row = result.one_or_none()
 
         # Step 2: Check event exists
-        if not event:
+        if not row:
             raise EventNotFoundException(
                 f"Event with ID {reservation_data.event_id} not found"
             )
+        event = row.Event
 
         # Step 3: Check user exists
-        user = await self.user_repo.get_by_id(user_id)
-        if not user:
+        if not row.user_exists:
             raise UserNotFoundException(
                 f"User with ID {user_id} not found"
             )
@@ -124,15 +131,13 @@ class TicketService:
                 f"Event '{event.title}' is sold out ({event.tickets_sold}/{event.total_tickets} tickets sold)"
             )
 
-        # Step 5: Calculate expiration time
-        expires_at = datetime.now(timezone.utc) + timedelta(seconds=settings.TICKET_EXPIRATION_TIME)
-
-        # Step 6: Create ticket with reserved status
+        # Step 5-6: Create ticket with reserved status
+        # Expiration is computed as statement_timestamp() + interval inside the INSERT
         ticket = await self.ticket_repo.create(
             user_id=user_id,
             event_id=reservation_data.event_id,
             status=TicketStatus.RESERVED,
-            expires_at=expires_at,
+            expires_in_seconds=settings.TICKET_EXPIRATION_TIME,
         )
 
         # Step 7: Increment tickets_sold atomically
@@ -180,11 +185,12 @@ class TicketService:
             InvalidStatusTransitionException: If ticket is not reserved
             TicketExpiredException: If ticket has expired
         """
-        # Get ticket with row lock
-        ticket = await self.ticket_repo.get_by_id_for_update(ticket_id)
+        # Get ticket with row lock; expiry is compared on the database clock
+        locked = await self.ticket_repo.get_by_id_for_update_with_expiry(ticket_id)
 
-        if not ticket:
+        if not locked:
             raise TicketNotFoundException(f"Ticket with ID {ticket_id} not found")
+        ticket, expired = locked
 
         # Check current status
         if ticket.status != TicketStatus.RESERVED:
@@ -194,7 +200,7 @@ class TicketService:
             )
 
         # Check expiration
-        if ticket.is_expired:
+        if expired:
             raise TicketExpiredException(
                 f"Ticket has expired at {ticket.expires_at}. Cannot process payment."
             )
@@ -210,8 +216,20 @@ class TicketService:
         await self.db.commit()
 
         # Cancel Celery expiration task
+        # Revoke directly rather than queueing cancel_expiration_task; it is a
+        # single broker publish. An unreachable broker is safe to tolerate: the
+        # ticket is already committed as PAID and the expiration task skips
+        # tickets that are no longer reserved.
         if CELERY_AVAILABLE and ticket.expiration_task_id:
-            cancel_expiration_task.delay(ticket.expiration_task_id)
+            try:
+                revoke_expiration_task(ticket.expiration_task_id)
+            except BrokerOperationalError:
+                logger.warning(
+                    "Could not revoke expiration task %s for paid ticket %s",
+                    ticket.expiration_task_id,
+                    ticket.id,
+                    exc_info=True,
+                )
 
         # Reload relationships
         await self.db.refresh(ticket, ["user", "event"])
@@ -2,8 +2,6 @@
 from typing import Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from geoalchemy2 import functions as geo_func
-from sqlalchemy import select
 
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import UserCreate, UserResponse, LocationUpdate
@@ -36,7 +34,7 @@ class UserService:
         )
 
         await self.db.commit()
-        return await self._user_to_response(user)
+        return self._user_to_response(user)
 
     async def get_user_by_id(self, user_id: UUID) -> Optional[UserResponse]:
         """
@@ -52,7 +50,7 @@ class UserService:
         if not user:
             return None
 
-        return await self._user_to_response(user)
+        return self._user_to_response(user)
 
     async def update_user_location(
         self, user_id: UUID, location_data: LocationUpdate
@@ -77,35 +75,9 @@ class UserService:
             return None
 
         await self.db.commit()
-        return await self._user_to_response(user)
+        return self._user_to_response(user)
 
-    async def _extract_coordinates(self, user: User) -> tuple[Optional[float], Optional[float]]:
-        """
-        Extract latitude and longitude from user location.
-
-        Args:
-            user: User object
-
-        Returns:
-            Tuple of (latitude, longitude) or (None, None)
-        """
-        if user.location is None:
-            return (None, None)
-
-        # Query to extract coordinates from geography type
-        result = await self.db.execute(
-            select(
-                geo_func.ST_Y(geo_func.ST_GeomFromWKB(user.location.data)).label("lat"),
-                geo_func.ST_X(geo_func.ST_GeomFromWKB(user.location.data)).label("lng"),
-            )
-        )
-        coords = result.first()
-
-        if coords:
-            return (float(coords.lat), float(coords.lng))
-        return (None, None)
-
-    async def _user_to_response(self, user: User) -> UserResponse:
+    def _user_to_response(self, user: User) -> UserResponse:
         """
         Convert User model to UserResponse.
 
@@ -115,14 +87,12 @@ class UserService:
         Returns:
             UserResponse object
         """
-        lat, lng = await self._extract_coordinates(user)
-
         return UserResponse(
             id=user.id,
             name=user.name,
             email=user.email,
-            latitude=lat,
-            longitude=lng,
+            latitude=user.latitude,
+            longitude=user.longitude,
             created_at=user.created_at,
             updated_at=user.updated_at,
         )
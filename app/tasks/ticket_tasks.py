@@ -1,11 +1,10 @@
 """Celery tasks for ticket management."""
 import asyncio
-from datetime import datetime, timezone
 from uuid import UUID
 from typing import List
 
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, update
 
 from app.celery_app import celery_app
 from app.config import settings
@@ -77,14 +76,21 @@ async def _expire_ticket_async(ticket_id: str):
             try:
                 ticket_uuid = UUID(ticket_id)
 
-                # Get ticket with lock
+                # Get ticket with lock, checking expiry against the database
+                # clock that stamped expires_at
                 result = await db.execute(
-                    select(Ticket).where(Ticket.id == ticket_uuid).with_for_update()
+                    select(
+                        Ticket,
+                        (Ticket.expires_at > func.statement_timestamp()).label("not_yet_expired"),
+                    )
+                    .where(Ticket.id == ticket_uuid)
+                    .with_for_update()
                 )
-                ticket = result.scalar_one_or_none()
+                row = result.one_or_none()
 
-                if not ticket:
+                if not row:
                     return {"status": "not_found", "message": f"Ticket {ticket_id} not found"}
+                ticket = row.Ticket
 
                 # Only expire if still reserved
                 if ticket.status != TicketStatus.RESERVED:
@@ -94,7 +100,7 @@ async def _expire_ticket_async(ticket_id: str):
                     }
 
                 # Check if actually expired
-                if ticket.expires_at and datetime.now(timezone.utc) < ticket.expires_at:
+                if row.not_yet_expired:
                     return {
                         "status": "not_yet_expired",
                         "message": f"Ticket {ticket_id} not yet expired",
@@ -156,15 +162,17 @@ async def _cleanup_expired_tickets_async():
     try:
         async with session_maker() as db:
             try:
-                now = datetime.now(timezone.utc)
-
-                # Find all reserved tickets that should be expired
+                # Find and lock all reserved tickets that should be expired
+                # (compared against the database clock, which set expires_at).
+                # Tickets locked by a concurrent payment or expire_ticket_task
+                # are skipped; the next run picks them up if still reserved.
                 result = await db.execute(
                     select(Ticket)
                     .where(Ticket.status == TicketStatus.RESERVED)
                     .where(Ticket.expires_at != None)
-                    .where(Ticket.expires_at < now)
+                    .where(Ticket.expires_at < func.now())
                     .limit(100)  # Process in batches
+                    .with_for_update(skip_locked=True)
                 )
                 expired_tickets: List[Ticket] = list(result.scalars().all())
 
@@ -188,9 +196,16 @@ async def _cleanup_expired_tickets_async():
                         )
                         event.tickets_sold = max(0, event.tickets_sold - tickets_to_expire)
 
-                # Update all ticket statuses
-                for ticket in expired_tickets:
-                    ticket.status = TicketStatus.EXPIRED
+                # Update all ticket statuses in a single UPDATE statement.
+                # Skipping session synchronization is safe: the stale in-memory
+                # tickets are never read again before the session closes.
+                await db.execute(
+                    update(Ticket)
+                    .where(Ticket.id.in_([ticket.id for ticket in expired_tickets]))
+                    .where(Ticket.status == TicketStatus.RESERVED)
+                    .values(status=TicketStatus.EXPIRED)
+                    .execution_options(synchronize_session=False)
+                )
 
                 await db.commit()
 
@@ -219,7 +234,22 @@ def cancel_expiration_task(task_id: str):
         task_id: Celery task ID to cancel
     """
     try:
-        celery_app.control.revoke(task_id, terminate=True)
+        revoke_expiration_task(task_id)
         return {"status": "cancelled", "task_id": task_id}
     except Exception as e:
         return {"status": "error", "message": str(e)}
+
+
+def revoke_expiration_task(task_id: str) -> None:
+    """
+    Revoke a scheduled expiration task without terminating workers.
+
+    Expiration tasks wait in the broker on a countdown, so a plain revoke is
+    enough for workers to drop them when they come due. terminate=True would
+    additionally signal a running task, which is never needed here because
+    _expire_ticket_async skips tickets that are no longer reserved.
+
+    Args:
+        task_id: Celery task ID to revoke
+    """
+    celery_app.control.revoke(task_id)
@@ -1,5 +1,6 @@
 """Tests for authentication API endpoints."""
 import pytest
+from uuid import UUID
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -29,15 +30,14 @@ class TestRegisterEndpoint:
 
         assert data["name"] == "New User"
         assert data["email"] == "newuser@example.com"
+        assert data["latitude"] == 37.7749
+        assert data["longitude"] == -122.4194
         assert "id" in data
         assert "created_at" in data
         assert "hashed_password" not in data  # Password should not be in response
 
         # Verify user was created in database
-        from sqlalchemy import select
-
-        result = await db_session.execute(select(User).where(User.email == "newuser@example.com"))
-        user = result.scalar_one_or_none()
+        user = await db_session.get(User, UUID(data["id"]))
 
         assert user is not None
         assert user.name == "New User"
@@ -72,44 +72,21 @@ class TestRegisterEndpoint:
         assert response.status_code == 400
         assert "already registered" in response.json()["detail"].lower()
 
-    async def test_register_invalid_email(self, async_client: AsyncClient):
-        """Test registration with invalid email format."""
-        response = await async_client.post(
-            "/api/v1/auth/register",
-            json={
-                "name": "Invalid Email",
-                "email": "not-an-email",
-                "password": "password123",
-            },
-        )
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"name": "Invalid Email", "email": "not-an-email", "password": "password123"},
+            {"name": "Short Password", "email": "short@example.com", "password": "123"},
+            {"email": "incomplete@example.com"},  # Missing name and password
+        ],
+        ids=["invalid_email", "short_password", "missing_required_fields"],
+    )
+    async def test_register_validation_error(self, async_client: AsyncClient, payload: dict):
+        """Test registration with invalid or incomplete data returns 422."""
+        response = await async_client.post("/api/v1/auth/register", json=payload)
 
         assert response.status_code == 422  # Validation error
 
-    async def test_register_short_password(self, async_client: AsyncClient):
-        """Test registration with password too short."""
-        response = await async_client.post(
-            "/api/v1/auth/register",
-            json={
-                "name": "Short Password",
-                "email": "short@example.com",
-                "password": "123",  # Too short
-            },
-        )
-
-        assert response.status_code == 422
-
-    async def test_register_missing_required_fields(self, async_client: AsyncClient):
-        """Test registration with missing required fields."""
-        response = await async_client.post(
-            "/api/v1/auth/register",
-            json={
-                "email": "incomplete@example.com",
-                # Missing name and password
-            },
-        )
-
-        assert response.status_code == 422
-
 
 @pytest.mark.asyncio
 class TestLoginEndpoint:
@@ -163,30 +140,20 @@ class TestLoginEndpoint:
         assert response.status_code == 401
         assert "invalid" in response.json()["detail"].lower()
 
-    async def test_login_invalid_email_format(self, async_client: AsyncClient):
-        """Test login with invalid email format."""
-        response = await async_client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": "not-an-email",
-                "password": "password123",
-            },
-        )
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"email": "not-an-email", "password": "password123"},
+            {"email": "test@example.com"},  # Missing password
+        ],
+        ids=["invalid_email_format", "missing_fields"],
+    )
+    async def test_login_validation_error(self, async_client: AsyncClient, payload: dict):
+        """Test login with invalid or incomplete data returns 422."""
+        response = await async_client.post("/api/v1/auth/login", json=payload)
 
         assert response.status_code == 422  # Validation error
 
-    async def test_login_missing_fields(self, async_client: AsyncClient):
-        """Test login with missing fields."""
-        response = await async_client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": "test@example.com",
-                # Missing password
-            },
-        )
-
-        assert response.status_code == 422
-
 
 @pytest.mark.asyncio
 class TestAuthenticationRequired:
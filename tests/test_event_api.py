@@ -1,36 +1,78 @@
 """Integration tests for event API endpoints."""
+import orjson
 import pytest
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
+from uuid import uuid4
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
+from app.repositories.event_repository import EventRepository
+
+
+VENUE = {
+    "latitude": 40.7128,
+    "longitude": -74.0060,
+    "venue_name": "Venue",
+    "address_line1": "123 St",
+    "city": "NYC",
+    "state": "NY",
+    "country": "USA",
+    "postal_code": "10001",
+}
+
+
+@pytest.fixture
+def future_times(future_window) -> tuple[str, str]:
+    """ISO start and end time of the shared one-week-out, 3-hour event window."""
+    start_time, end_time = future_window
+    return start_time.isoformat(), end_time.isoformat()
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+async def post_event(client: AsyncClient, payload: dict, headers: dict):
+    """POST an event body serialized with orjson instead of httpx's stdlib json.dumps."""
+    return await client.post(
+        "/api/v1/events/", content=orjson.dumps(payload), headers={**headers, **JSON_HEADERS}
+    )
+
+
+async def seed_events(db_session: AsyncSession, creator: User, start_times: list) -> None:
+    """Insert one 3-hour event per start time with EventRepository.bulk_insert."""
+    await EventRepository(db_session).bulk_insert(
+        [
+            {
+                "creator_id": creator.id,
+                "title": f"Event {i}",
+                "start_time": start_time,
+                "end_time": start_time + timedelta(hours=3),
+                "total_tickets": 100,
+                **VENUE,
+            }
+            for i, start_time in enumerate(start_times)
+        ]
+    )
 
 
 @pytest.mark.asyncio
-async def test_post_events_success_201(async_client: AsyncClient, test_user: User, auth_headers: dict):
+async def test_post_events_success_201(
+    async_client: AsyncClient, test_user: User, auth_headers: dict, future_times
+):
     """Test POST /events/ creates an event successfully."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
+    start_time, end_time = future_times
 
     payload = {
         "title": "Tech Conference 2025",
         "description": "Annual tech conference",
-        "start_time": start_time.isoformat(),
-        "end_time": end_time.isoformat(),
+        "start_time": start_time,
+        "end_time": end_time,
         "total_tickets": 500,
-        "venue": {
-            "latitude": 40.7128,
-            "longitude": -74.0060,
-            "venue_name": "Convention Center",
-            "address_line1": "123 Main St",
-            "city": "New York",
-            "state": "NY",
-            "country": "USA",
-            "postal_code": "10001",
-        },
+        "venue": VENUE,
     }
 
-    response = await async_client.post("/api/v1/events/", json=payload, headers=auth_headers)
+    response = await post_event(async_client, payload, auth_headers)
 
     assert response.status_code == 201
     data = response.json()
@@ -44,86 +86,48 @@ async def test_post_events_success_201(async_client: AsyncClient, test_user: Use
 
 
 @pytest.mark.asyncio
-async def test_post_events_invalid_data_422(async_client: AsyncClient, auth_headers: dict):
+@pytest.mark.parametrize(
+    "start_offset,duration,venue",
+    [
+        (timedelta(days=7), timedelta(hours=-1), VENUE),  # End before start
+        (timedelta(days=-1), timedelta(hours=3), VENUE),  # Start in the past
+        (timedelta(days=7), timedelta(hours=3), {**VENUE, "latitude": 100.0}),  # Out of range
+    ],
+    ids=["end_before_start", "past_start_time", "invalid_coordinates"],
+)
+async def test_post_events_invalid_data_422(
+    async_client: AsyncClient,
+    auth_headers: dict,
+    frozen_now: datetime,
+    start_offset: timedelta,
+    duration: timedelta,
+    venue: dict,
+):
     """Test POST /events/ with invalid data returns 422."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time - timedelta(hours=1)  # End before start (invalid)
+    start_time = frozen_now + start_offset
+    end_time = start_time + duration
 
     payload = {
         "title": "Invalid Event",
         "start_time": start_time.isoformat(),
-        "end_time": end_time.isoformat(),  # Invalid: end before start
-        "total_tickets": 100,
-        "venue": {
-            "latitude": 40.7128,
-            "longitude": -74.0060,
-            "venue_name": "Venue",
-            "address_line1": "123 St",
-            "city": "NYC",
-            "state": "NY",
-            "country": "USA",
-            "postal_code": "10001",
-        },
-    }
-
-    response = await async_client.post("/api/v1/events/", json=payload, headers=auth_headers)
-
-    assert response.status_code == 422
-
-
-@pytest.mark.asyncio
-async def test_post_events_past_date_rejected(async_client: AsyncClient, auth_headers: dict):
-    """Test that past events are rejected."""
-    start_time = datetime.now(timezone.utc) - timedelta(days=1)  # Past
-    end_time = start_time + timedelta(hours=3)
-
-    payload = {
-        "title": "Past Event",
-        "start_time": start_time.isoformat(),
         "end_time": end_time.isoformat(),
         "total_tickets": 100,
-        "venue": {
-            "latitude": 40.7128,
-            "longitude": -74.0060,
-            "venue_name": "Venue",
-            "address_line1": "123 St",
-            "city": "NYC",
-            "state": "NY",
-            "country": "USA",
-            "postal_code": "10001",
-        },
+        "venue": venue,
     }
 
-    response = await async_client.post("/api/v1/events/", json=payload, headers=auth_headers)
+    response = await post_event(async_client, payload, auth_headers)
 
     assert response.status_code == 422
 
 
 @pytest.mark.asyncio
-async def test_get_events_returns_list_200(async_client: AsyncClient, auth_headers: dict):
+async def test_get_events_returns_list_200(
+    async_client: AsyncClient, db_session: AsyncSession, test_user: User, frozen_now: datetime
+):
     """Test GET /events/ returns list of events."""
     # Create test events
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    for i in range(3):
-        payload = {
-            "title": f"Event {i}",
-            "start_time": (start_time + timedelta(days=i)).isoformat(),
-            "end_time": (end_time + timedelta(days=i)).isoformat(),
-            "total_tickets": 100,
-            "venue": {
-                "latitude": 40.7128,
-                "longitude": -74.0060,
-                "venue_name": "Venue",
-                "address_line1": "123 St",
-                "city": "NYC",
-                "state": "NY",
-                "country": "USA",
-                "postal_code": "10001",
-            },
-        }
-        await async_client.post("/api/v1/events/", json=payload, headers=auth_headers)
+    start_time = frozen_now + timedelta(days=7)
+    await seed_events(db_session, test_user, [start_time + timedelta(days=i) for i in range(3)])
 
     # Get all events
     response = await async_client.get("/api/v1/events/")
@@ -137,30 +141,13 @@ async def test_get_events_returns_list_200(async_client: AsyncClient, auth_heade
 
 
 @pytest.mark.asyncio
-async def test_get_events_pagination_works(async_client: AsyncClient, auth_headers: dict):
+async def test_get_events_pagination_works(
+    async_client: AsyncClient, db_session: AsyncSession, test_user: User, frozen_now: datetime
+):
     """Test that pagination works for GET /events/."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
     # Create 5 events
-    for i in range(5):
-        payload = {
-            "title": f"Event {i}",
-            "start_time": (start_time + timedelta(days=i)).isoformat(),
-            "end_time": (end_time + timedelta(days=i)).isoformat(),
-            "total_tickets": 100,
-            "venue": {
-                "latitude": 40.7128,
-                "longitude": -74.0060,
-                "venue_name": "Venue",
-                "address_line1": "123 St",
-                "city": "NYC",
-                "state": "NY",
-                "country": "USA",
-                "postal_code": "10001",
-            },
-        }
-        await async_client.post("/api/v1/events/", json=payload, headers=auth_headers)
+    start_time = frozen_now + timedelta(days=7)
+    await seed_events(db_session, test_user, [start_time + timedelta(days=i) for i in range(5)])
 
     # Get first page (limit 2)
     response = await async_client.get("/api/v1/events/?skip=0&limit=2")
@@ -193,44 +180,14 @@ async def test_get_events_empty_list(async_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_events_upcoming_only_filter(async_client: AsyncClient, auth_headers: dict):
+async def test_get_events_upcoming_only_filter(
+    async_client: AsyncClient, db_session: AsyncSession, test_user: User, frozen_now: datetime
+):
     """Test GET /events/ with upcoming_only filter."""
-    venue = {
-        "latitude": 40.7128,
-        "longitude": -74.0060,
-        "venue_name": "Venue",
-        "address_line1": "123 St",
-        "city": "NYC",
-        "state": "NY",
-        "country": "USA",
-        "postal_code": "10001",
-    }
-
-    # Create near future event (starts soon)
-    near_future_start = datetime.now(timezone.utc) + timedelta(days=1)
-    near_future_end = near_future_start + timedelta(hours=3)
-    payload_near = {
-        "title": "Near Future Event",
-        "start_time": near_future_start.isoformat(),
-        "end_time": near_future_end.isoformat(),
-        "total_tickets": 100,
-        "venue": venue,
-    }
-    response1 = await async_client.post("/api/v1/events/", json=payload_near, headers=auth_headers)
-    assert response1.status_code == 201
-
-    # Create far future event
-    far_future_start = datetime.now(timezone.utc) + timedelta(days=30)
-    far_future_end = far_future_start + timedelta(hours=3)
-    payload_far = {
-        "title": "Far Future Event",
-        "start_time": far_future_start.isoformat(),
-        "end_time": far_future_end.isoformat(),
-        "total_tickets": 100,
-        "venue": venue,
-    }
-    response2 = await async_client.post("/api/v1/events/", json=payload_far, headers=auth_headers)
-    assert response2.status_code == 201
+    # Create a near future event (starts soon) and a far future event
+    await seed_events(
+        db_session, test_user, [frozen_now + timedelta(days=1), frozen_now + timedelta(days=30)]
+    )
 
     # Get all events
     response = await async_client.get("/api/v1/events/")
@@ -244,31 +201,23 @@ async def test_get_events_upcoming_only_filter(async_client: AsyncClient, auth_h
 
 
 @pytest.mark.asyncio
-async def test_get_event_by_id_success(async_client: AsyncClient, auth_headers: dict):
+async def test_get_event_by_id_success(
+    async_client: AsyncClient, auth_headers: dict, future_times
+):
     """Test GET /events/{event_id} returns event details."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
+    start_time, end_time = future_times
 
     payload = {
         "title": "Test Event",
         "description": "Test Description",
-        "start_time": start_time.isoformat(),
-        "end_time": end_time.isoformat(),
+        "start_time": start_time,
+        "end_time": end_time,
         "total_tickets": 100,
-        "venue": {
-            "latitude": 40.7128,
-            "longitude": -74.0060,
-            "venue_name": "Test Venue",
-            "address_line1": "123 Test St",
-            "city": "NYC",
-            "state": "NY",
-            "country": "USA",
-            "postal_code": "10001",
-        },
+        "venue": {**VENUE, "venue_name": "Test Venue"},
     }
 
     # Create event
-    create_response = await async_client.post("/api/v1/events/", json=payload, headers=auth_headers)
+    create_response = await post_event(async_client, payload, auth_headers)
     event_id = create_response.json()["id"]
 
     # Get event by ID
@@ -285,8 +234,6 @@ async def test_get_event_by_id_success(async_client: AsyncClient, auth_headers:
 @pytest.mark.asyncio
 async def test_get_event_by_id_not_found(async_client: AsyncClient):
     """Test GET /events/{event_id} with non-existent ID returns 404."""
-    from uuid import uuid4
-
     fake_id = str(uuid4())
     response = await async_client.get(f"/api/v1/events/{fake_id}")
 
@@ -294,34 +241,6 @@ async def test_get_event_by_id_not_found(async_client: AsyncClient):
     assert "not found" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
-async def test_post_events_invalid_coordinates(async_client: AsyncClient, auth_headers: dict):
-    """Test that invalid coordinates are rejected."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    payload = {
-        "title": "Invalid Location",
-        "start_time": start_time.isoformat(),
-        "end_time": end_time.isoformat(),
-        "total_tickets": 100,
-        "venue": {
-            "latitude": 100.0,  # Invalid (out of range)
-            "longitude": -74.0060,
-            "venue_name": "Venue",
-            "address_line1": "123 St",
-            "city": "NYC",
-            "state": "NY",
-            "country": "USA",
-            "postal_code": "10001",
-        },
-    }
-
-    response = await async_client.post("/api/v1/events/", json=payload, headers=auth_headers)
-
-    assert response.status_code == 422
-
-
 @pytest.mark.asyncio
 async def test_health_check_endpoint(async_client: AsyncClient):
     """Test /health endpoint with database connectivity check."""
@@ -1,207 +1,208 @@
 """Tests for event repository."""
 import pytest
-from datetime import datetime, timedelta, timezone
+import pytest_asyncio
+from datetime import timedelta
 from uuid import uuid4
 
-from app.repositories.event_repository import EventRepository
 from app.models.event import Event
 
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_create_event_returns_event(db_session, test_user):
-    """Test that create() returns an event with ID."""
-    repository = EventRepository(db_session)
-
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    event = await repository.create(
-        creator_id=test_user.id,
-        title="Test Event",
-        description="Test Description",
-        start_time=start_time,
-        end_time=end_time,
-        total_tickets=100,
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Test Venue",
-        address_line1="123 Test St",
-        city="New York",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-
-    assert event.id is not None
-    assert event.title == "Test Event"
-    assert event.total_tickets == 100
-    assert event.tickets_sold == 0
+def event_data(creator_id, title: str, start_time, end_time) -> dict:
+    """Keyword arguments for one 100-ticket NYC event, as accepted by the bulk helpers."""
+    return {
+        "creator_id": creator_id,
+        "title": title,
+        "start_time": start_time,
+        "end_time": end_time,
+        "total_tickets": 100,
+        "latitude": 40.7128,
+        "longitude": -74.0060,
+        "venue_name": "Venue",
+        "address_line1": "123 St",
+        "city": "NYC",
+        "state": "NY",
+        "country": "USA",
+        "postal_code": "10001",
+    }
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_get_event_by_id_found(db_session, test_user):
-    """Test getting an event by ID when it exists."""
-    repository = EventRepository(db_session)
-    # Use test_user.id instead
-
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    created_event = await repository.create(
-        creator_id=test_user.id,
-        title="Test Event",
-        start_time=start_time,
-        end_time=end_time,
-        total_tickets=100,
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Test Venue",
-        address_line1="123 Test St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-    await db_session.commit()
+class TestEventRepository:
+    """Tests for EventRepository against the per-test database session."""
 
-    found_event = await repository.get_by_id(created_event.id)
-
-    assert found_event is not None
-    assert found_event.id == created_event.id
-    assert found_event.title == "Test Event"
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_event_by_id_not_found(db_session):
-    """Test getting an event by ID when it doesn't exist."""
-    repository = EventRepository(db_session)
-
-    from uuid import uuid4
-
-    non_existent_id = uuid4()
-    found_event = await repository.get_by_id(non_existent_id)
-
-    assert found_event is None
+    async def test_create_event_returns_event(self, db_session, repository, test_user, frozen_now):
+        """Test that create() returns an event with ID."""
+        start_time = frozen_now + timedelta(days=7)
+        end_time = start_time + timedelta(hours=3)
 
+        event = await repository.create(
+            creator_id=test_user.id,
+            title="Test Event",
+            description="Test Description",
+            start_time=start_time,
+            end_time=end_time,
+            total_tickets=100,
+            latitude=40.7128,
+            longitude=-74.0060,
+            venue_name="Test Venue",
+            address_line1="123 Test St",
+            city="New York",
+            state="NY",
+            country="USA",
+            postal_code="10001",
+        )
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_all_events_with_pagination(db_session, test_user):
-    """Test getting all events with pagination."""
-    repository = EventRepository(db_session)
-    # Use test_user.id instead
+        assert event.id is not None
+        assert event.title == "Test Event"
+        assert event.total_tickets == 100
+        assert event.tickets_sold == 0
 
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
+    async def test_get_event_by_id_found(self, db_session, repository, test_user, frozen_now):
+        """Test getting an event by ID when it exists."""
+        start_time = frozen_now + timedelta(days=7)
+        end_time = start_time + timedelta(hours=3)
 
-    # Create 5 events
-    for i in range(5):
-        await repository.create(
+        created_event = await repository.create(
             creator_id=test_user.id,
-            title=f"Event {i}",
-            start_time=start_time + timedelta(days=i),
-            end_time=end_time + timedelta(days=i),
+            title="Test Event",
+            start_time=start_time,
+            end_time=end_time,
             total_tickets=100,
             latitude=40.7128,
             longitude=-74.0060,
-            venue_name="Venue",
-            address_line1="123 St",
+            venue_name="Test Venue",
+            address_line1="123 Test St",
             city="NYC",
             state="NY",
             country="USA",
             postal_code="10001",
         )
-    await db_session.commit()
 
-    # Get first 3 events
-    events = await repository.get_all(skip=0, limit=3)
-    assert len(events) == 3
+        found_event = await repository.get_by_id(created_event.id)
+
+        assert found_event is not None
+        assert found_event.id == created_event.id
+        assert found_event.title == "Test Event"
+
+    async def test_get_event_by_id_not_found(self, db_session, repository):
+        """Test getting an event by ID when it doesn't exist."""
+        non_existent_id = uuid4()
+        found_event = await repository.get_by_id(non_existent_id)
+
+        assert found_event is None
+
+    async def test_get_all_events_with_pagination(
+        self, db_session, repository, test_user, frozen_now
+    ):
+        """Test getting all events with pagination."""
+        start_time = frozen_now + timedelta(days=7)
+        end_time = start_time + timedelta(hours=3)
+
+        # Create 5 events
+        await repository.bulk_insert(
+            [
+                event_data(
+                    test_user.id,
+                    f"Event {i}",
+                    start_time + timedelta(days=i),
+                    end_time + timedelta(days=i),
+                )
+                for i in range(5)
+            ]
+        )
 
-    # Get next 2 events
-    events = await repository.get_all(skip=3, limit=3)
-    assert len(events) == 2
+        # Get first 3 events
+        events = await repository.get_all(skip=0, limit=3)
+        assert len(events) == 3
+
+        # Get next 2 events
+        events = await repository.get_all(skip=3, limit=3)
+        assert len(events) == 2
+
+    async def test_get_all_events_empty_database(self, db_session, repository):
+        """Test getting all events from empty database."""
+        events = await repository.get_all()
+        assert len(events) == 0
+
+    async def test_get_all_events_upcoming_only(
+        self, db_session, repository, test_user, frozen_now
+    ):
+        """Test getting only upcoming events."""
+        # Create past and future event
+        past_start = frozen_now - timedelta(days=7)
+        past_end = past_start + timedelta(hours=3)
+        future_start = frozen_now + timedelta(days=7)
+        future_end = future_start + timedelta(hours=3)
+        await repository.bulk_insert(
+            [
+                event_data(test_user.id, "Past Event", past_start, past_end),
+                event_data(test_user.id, "Future Event", future_start, future_end),
+            ]
+        )
 
+        # Get only upcoming events
+        events = await repository.get_all(upcoming_only=True)
+        assert len(events) == 1
+        assert events[0].title == "Future Event"
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_all_events_empty_database(db_session):
-    """Test getting all events from empty database."""
-    repository = EventRepository(db_session)
-
-    events = await repository.get_all()
-    assert len(events) == 0
+    async def test_count_all_events(self, db_session, repository, test_user, frozen_now):
+        """Test counting all events."""
+        start_time = frozen_now + timedelta(days=7)
+        end_time = start_time + timedelta(hours=3)
 
+        # Create 3 events
+        await repository.bulk_insert(
+            [event_data(test_user.id, f"Event {i}", start_time, end_time) for i in range(3)]
+        )
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_all_events_upcoming_only(db_session, test_user):
-    """Test getting only upcoming events."""
-    repository = EventRepository(db_session)
-    # Use test_user.id instead
-
-    # Create past event
-    past_start = datetime.now(timezone.utc) - timedelta(days=7)
-    past_end = past_start + timedelta(hours=3)
-    await repository.create(
-        creator_id=test_user.id,
-        title="Past Event",
-        start_time=past_start,
-        end_time=past_end,
-        total_tickets=100,
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
+        count = await repository.count_all()
+        assert count == 3
 
-    # Create future event
-    future_start = datetime.now(timezone.utc) + timedelta(days=7)
-    future_end = future_start + timedelta(hours=3)
-    await repository.create(
-        creator_id=test_user.id,
-        title="Future Event",
-        start_time=future_start,
-        end_time=future_end,
-        total_tickets=100,
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
+    @pytest_asyncio.fixture
+    async def seeded_event(self, db_session, repository, test_user, frozen_now):
+        """Single event whose tickets_sold each counter case overwrites."""
+        start_time = frozen_now + timedelta(days=7)
+        end_time = start_time + timedelta(hours=3)
+        (event,) = await repository.bulk_create(
+            [event_data(test_user.id, "Test Event", start_time, end_time)]
+        )
+        return event
+
+    @pytest.mark.parametrize(
+        "op,initial,amount,expected",
+        [
+            ("increment", 0, 1, 1),
+            ("increment", 1, 5, 6),
+            ("decrement", 10, 1, 9),
+            ("decrement", 9, 5, 4),
+            ("decrement", 2, 10, 0),  # Clamped at 0, not negative
+        ],
+        ids=["inc_1", "inc_5", "dec_1", "dec_5", "dec_below_zero"],
     )
-    await db_session.commit()
-
-    # Get only upcoming events
-    events = await repository.get_all(upcoming_only=True)
-    assert len(events) == 1
-    assert events[0].title == "Future Event"
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_count_all_events(db_session, test_user):
-    """Test counting all events."""
-    repository = EventRepository(db_session)
-    # Use test_user.id instead
-
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    # Create 3 events
-    for i in range(3):
-        await repository.create(
+    async def test_tickets_sold_counter(
+        self, db_session, repository, seeded_event, op, initial, amount, expected
+    ):
+        """Test incrementing and decrementing the tickets_sold counter."""
+        seeded_event.tickets_sold = initial
+        await db_session.flush()
+
+        update_counter = getattr(repository, f"{op}_tickets_sold")
+        assert await update_counter(seeded_event.id, amount=amount) == expected
+
+    async def test_tickets_sold_counter_event_not_found(self, repository):
+        """Test that updating the counter of a missing event returns None."""
+        assert await repository.increment_tickets_sold(uuid4()) is None
+        assert await repository.decrement_tickets_sold(uuid4()) is None
+
+    async def test_delete_event(self, db_session, repository, test_user, frozen_now):
+        """Test deleting an event."""
+        start_time = frozen_now + timedelta(days=7)
+        end_time = start_time + timedelta(hours=3)
+
+        event = await repository.create(
             creator_id=test_user.id,
-            title=f"Event {i}",
+            title="Test Event",
             start_time=start_time,
             end_time=end_time,
             total_tickets=100,
@@ -214,166 +215,13 @@ async def test_count_all_events(db_session, test_user):
             country="USA",
             postal_code="10001",
         )
-    await db_session.commit()
-
-    count = await repository.count_all()
-    assert count == 3
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_increment_tickets_sold(db_session, test_user):
-    """Test incrementing tickets_sold counter."""
-    repository = EventRepository(db_session)
-    # Use test_user.id instead
-
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    event = await repository.create(
-        creator_id=test_user.id,
-        title="Test Event",
-        start_time=start_time,
-        end_time=end_time,
-        total_tickets=100,
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-    await db_session.commit()
-
-    assert event.tickets_sold == 0
-
-    # Increment by 1
-    await repository.increment_tickets_sold(event.id)
-    await db_session.commit()
-    await db_session.refresh(event)
-    assert event.tickets_sold == 1
-
-    # Increment by 5
-    await repository.increment_tickets_sold(event.id, amount=5)
-    await db_session.commit()
-    await db_session.refresh(event)
-    assert event.tickets_sold == 6
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_decrement_tickets_sold(db_session, test_user):
-    """Test decrementing tickets_sold counter."""
-    repository = EventRepository(db_session)
-    # Use test_user.id instead
-
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    event = await repository.create(
-        creator_id=test_user.id,
-        title="Test Event",
-        start_time=start_time,
-        end_time=end_time,
-        total_tickets=100,
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-    event.tickets_sold = 10
-    await db_session.commit()
-
-    # Decrement by 1
-    await repository.decrement_tickets_sold(event.id)
-    await db_session.commit()
-    await db_session.refresh(event)
-    assert event.tickets_sold == 9
-
-    # Decrement by 5
-    await repository.decrement_tickets_sold(event.id, amount=5)
-    await db_session.commit()
-    await db_session.refresh(event)
-    assert event.tickets_sold == 4
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_decrement_tickets_sold_does_not_go_negative(db_session, test_user):
-    """Test that tickets_sold doesn't go below 0."""
-    repository = EventRepository(db_session)
-    # Use test_user.id instead
-
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    event = await repository.create(
-        creator_id=test_user.id,
-        title="Test Event",
-        start_time=start_time,
-        end_time=end_time,
-        total_tickets=100,
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-    event.tickets_sold = 2
-    await db_session.commit()
-
-    # Try to decrement by more than available
-    await repository.decrement_tickets_sold(event.id, amount=10)
-    await db_session.commit()
-    await db_session.refresh(event)
-
-    # Should be 0, not negative
-    assert event.tickets_sold == 0
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_delete_event(db_session, test_user):
-    """Test deleting an event."""
-    repository = EventRepository(db_session)
-    # Use test_user.id instead
-
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    event = await repository.create(
-        creator_id=test_user.id,
-        title="Test Event",
-        start_time=start_time,
-        end_time=end_time,
-        total_tickets=100,
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-    await db_session.commit()
 
-    event_id = event.id
+        event_id = event.id
 
-    # Delete event
-    result = await repository.delete(event_id)
-    await db_session.commit()
-    assert result is True
+        # Delete event
+        result = await repository.delete(event_id)
+        assert result is True
 
-    # Verify it's deleted
-    found_event = await repository.get_by_id(event_id)
-    assert found_event is None
+        # Verify it's deleted
+        found_event = await repository.get_by_id(event_id)
+        assert found_event is None
@@ -1,27 +1,15 @@
 """Tests for event Pydantic schemas."""
 import pytest
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from pydantic import ValidationError
 
 from app.schemas.event import VenueSchema, EventCreate, EventResponse
 
 
 @pytest.mark.unit
-def test_event_create_schema_validation():
+def test_event_create_schema_validation(default_venue, future_window):
     """Test that EventCreate schema validates correct data."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    venue = VenueSchema(
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Madison Square Garden",
-        address_line1="4 Pennsylvania Plaza",
-        city="New York",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
+    start_time, end_time = future_window
 
     event_data = EventCreate(
         title="Tech Conference 2025",
@@ -29,7 +17,7 @@ def test_event_create_schema_validation():
         start_time=start_time,
         end_time=end_time,
         total_tickets=500,
-        venue=venue,
+        venue=default_venue,
     )
 
     assert event_data.title == "Tech Conference 2025"
@@ -38,198 +26,94 @@ def test_event_create_schema_validation():
     assert event_data.venue.longitude == -74.0060
 
 
-@pytest.mark.unit
-def test_invalid_datetime_range_rejected():
-    """Test that EventCreate rejects invalid datetime ranges."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time - timedelta(hours=1)  # End before start
-
-    venue = VenueSchema(
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-
-    with pytest.raises(ValidationError) as exc_info:
-        EventCreate(
-            title="Invalid Event",
-            start_time=start_time,
-            end_time=end_time,
-            total_tickets=100,
-            venue=venue,
-        )
-
-    assert "start_time must be before end_time" in str(exc_info.value)
+@pytest.fixture
+def event_kwargs(default_venue, future_window) -> dict:
+    """Keyword arguments for a valid EventCreate, for tests to override."""
+    start_time, end_time = future_window
+    return {
+        "title": "Event",
+        "start_time": start_time,
+        "end_time": end_time,
+        "total_tickets": 100,
+        "venue": default_venue,
+    }
 
 
 @pytest.mark.unit
-def test_past_start_time_rejected():
-    """Test that EventCreate rejects events with start_time in the past."""
-    start_time = datetime.now(timezone.utc) - timedelta(days=1)  # Past
-    end_time = start_time + timedelta(hours=3)
-
-    venue = VenueSchema(
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-
+@pytest.mark.parametrize(
+    "overrides,message",
+    [
+        (
+            lambda e: {"end_time": e["start_time"] - timedelta(hours=1)},
+            "start_time must be before end_time",
+        ),
+        (
+            lambda e: {
+                "start_time": e["start_time"] - timedelta(days=8),
+                "end_time": e["end_time"] - timedelta(days=8),
+            },
+            "start_time must be in the future",
+        ),
+        (
+            lambda e: {
+                "start_time": e["start_time"].replace(tzinfo=None),
+                "end_time": e["end_time"].replace(tzinfo=None),
+            },
+            "must be timezone-aware",
+        ),
+        (lambda e: {"total_tickets": -10}, None),
+        (lambda e: {"total_tickets": 0}, None),
+        (lambda e: {"title": ""}, None),
+    ],
+    ids=[
+        "end_before_start",
+        "past_start_time",
+        "naive_datetime",
+        "negative_tickets",
+        "zero_tickets",
+        "empty_title",
+    ],
+)
+def test_event_create_rejects_invalid(event_kwargs, overrides, message):
+    """Test that EventCreate rejects invalid field values."""
     with pytest.raises(ValidationError) as exc_info:
-        EventCreate(
-            title="Past Event",
-            start_time=start_time,
-            end_time=end_time,
-            total_tickets=100,
-            venue=venue,
-        )
+        EventCreate(**{**event_kwargs, **overrides(event_kwargs)})
 
-    assert "start_time must be in the future" in str(exc_info.value)
+    if message:
+        assert message in str(exc_info.value)
 
 
 @pytest.mark.unit
-def test_negative_ticket_quantity_rejected():
-    """Test that negative ticket quantities are rejected."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    venue = VenueSchema(
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-
-    with pytest.raises(ValidationError):
-        EventCreate(
-            title="Invalid Tickets",
-            start_time=start_time,
-            end_time=end_time,
-            total_tickets=-10,  # Negative
-            venue=venue,
-        )
-
-
-@pytest.mark.unit
-def test_zero_ticket_quantity_rejected():
-    """Test that zero ticket quantities are rejected."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
+@pytest.mark.parametrize(
+    "latitude,longitude",
+    [(90.0, 180.0), (-90.0, -180.0)],  # Inclusive -90..90 / -180..180 bounds
+)
+def test_venue_coordinates_validation(default_venue, latitude, longitude):
+    """Test that venue coordinates on the range boundaries are accepted."""
     venue = VenueSchema(
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
+        **{**default_venue.model_dump(), "latitude": latitude, "longitude": longitude}
     )
 
-    with pytest.raises(ValidationError):
-        EventCreate(
-            title="No Tickets",
-            start_time=start_time,
-            end_time=end_time,
-            total_tickets=0,  # Zero
-            venue=venue,
-        )
-
-
-@pytest.mark.unit
-def test_venue_coordinates_validation():
-    """Test that venue coordinates are validated."""
-    # Valid coordinates
-    venue = VenueSchema(
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-    assert venue.latitude == 40.7128
-    assert venue.longitude == -74.0060
+    assert venue.latitude == latitude
+    assert venue.longitude == longitude
 
 
 @pytest.mark.unit
-def test_invalid_latitude_rejected():
-    """Test that invalid latitude values are rejected."""
-    # Latitude out of range (-90 to 90)
+def test_venue_schema_is_immutable(default_venue):
+    """Test that a validated venue cannot be mutated after construction."""
     with pytest.raises(ValidationError):
-        VenueSchema(
-            latitude=100.0,  # Invalid
-            longitude=-74.0060,
-            venue_name="Venue",
-            address_line1="123 St",
-            city="NYC",
-            state="NY",
-            country="USA",
-            postal_code="10001",
-        )
+        default_venue.latitude = 0.0
 
 
 @pytest.mark.unit
-def test_invalid_longitude_rejected():
-    """Test that invalid longitude values are rejected."""
-    # Longitude out of range (-180 to 180)
+@pytest.mark.parametrize(
+    "field,value",
+    [("latitude", 100.0), ("longitude", 200.0)],  # Outside -90..90 / -180..180
+)
+def test_venue_rejects_out_of_range_coordinates(default_venue, field, value):
+    """Test that out-of-range venue coordinates are rejected."""
     with pytest.raises(ValidationError):
-        VenueSchema(
-            latitude=40.7128,
-            longitude=200.0,  # Invalid
-            venue_name="Venue",
-            address_line1="123 St",
-            city="NYC",
-            state="NY",
-            country="USA",
-            postal_code="10001",
-        )
-
-
-@pytest.mark.unit
-def test_timezone_aware_datetime_required():
-    """Test that timezone-aware datetime is required."""
-    # Naive datetime (no timezone)
-    start_time = datetime.now() + timedelta(days=7)  # No timezone
-    end_time = start_time + timedelta(hours=3)
-
-    venue = VenueSchema(
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-
-    with pytest.raises(ValidationError) as exc_info:
-        EventCreate(
-            title="Naive Datetime Event",
-            start_time=start_time,
-            end_time=end_time,
-            total_tickets=100,
-            venue=venue,
-        )
-
-    assert "must be timezone-aware" in str(exc_info.value)
+        VenueSchema(**{**default_venue.model_dump(), field: value})
 
 
 @pytest.mark.unit
@@ -244,55 +128,16 @@ def test_venue_required_fields():
 
 
 @pytest.mark.unit
-def test_event_title_not_empty():
-    """Test that event title cannot be empty."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    venue = VenueSchema(
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
-
-    with pytest.raises(ValidationError):
-        EventCreate(
-            title="",  # Empty string
-            start_time=start_time,
-            end_time=end_time,
-            total_tickets=100,
-            venue=venue,
-        )
-
-
-@pytest.mark.unit
-def test_optional_description():
+def test_optional_description(default_venue, future_window):
     """Test that description is optional."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-
-    venue = VenueSchema(
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-    )
+    start_time, end_time = future_window
 
     event = EventCreate(
         title="Event without description",
         start_time=start_time,
         end_time=end_time,
         total_tickets=100,
-        venue=venue,
+        venue=default_venue,
         # No description
     )
 
@@ -300,18 +145,7 @@ def test_optional_description():
 
 
 @pytest.mark.unit
-def test_optional_address_line2():
+def test_optional_address_line2(default_venue):
     """Test that address_line2 is optional in venue."""
-    venue = VenueSchema(
-        latitude=40.7128,
-        longitude=-74.0060,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-        # No address_line2
-    )
-
-    assert venue.address_line2 is None
+    # default_venue is built without address_line2
+    assert default_venue.address_line2 is None
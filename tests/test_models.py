@@ -1,25 +1,32 @@
 """Tests for database models."""
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from geoalchemy2.elements import WKTElement
+from geoalchemy2.shape import to_shape
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from app.models import User, Event, Ticket, TicketStatus
-from app.utils.auth import hash_password
+
+
+# Shared venue points; WKT format is POINT(longitude latitude)
+NYC_POINT = WKTElement("POINT(-73.935242 40.730610)", srid=4326)
+LA_POINT = WKTElement("POINT(-118.243683 34.052235)", srid=4326)
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_user_model_creation(db_session):
+async def test_user_model_creation(db_session, hashed_password):
     """Test creating a User model instance."""
     user = User(
         name="John Doe",
         email="john@example.com",
-        hashed_password=hash_password("testpassword"),
+        hashed_password=hashed_password,
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
 
     assert user.id is not None
     assert user.name == "John Doe"
@@ -30,58 +37,54 @@ async def test_user_model_creation(db_session):
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_user_email_uniqueness(db_session):
+async def test_user_email_uniqueness(db_session, hashed_password):
     """Test that user email must be unique."""
-    user1 = User(name="John Doe", email="john@example.com", hashed_password=hash_password("test"))
+    user1 = User(name="John Doe", email="john@example.com", hashed_password=hashed_password)
     db_session.add(user1)
-    await db_session.commit()
-
-    user2 = User(name="Jane Doe", email="john@example.com", hashed_password=hash_password("test"))
-    db_session.add(user2)
+    await db_session.flush()
 
-    with pytest.raises(Exception):  # IntegrityError for duplicate email
-        await db_session.commit()
+    user2 = User(name="Jane Doe", email="john@example.com", hashed_password=hashed_password)
 
-    # Rollback the session after the expected error
-    await db_session.rollback()
+    # The savepoint absorbs the failure, so the test transaction stays usable
+    with pytest.raises(IntegrityError):
+        async with db_session.begin_nested():
+            db_session.add(user2)
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_user_with_location(db_session):
+async def test_user_with_location(db_session, hashed_password):
     """Test creating a user with geospatial location."""
-    # WKT format: POINT(longitude latitude)
-    location = WKTElement("POINT(-73.935242 40.730610)", srid=4326)
-
     user = User(
         name="John Doe",
         email="john@example.com",
-        hashed_password=hash_password("testpassword"),
-        location=location,
+        hashed_password=hashed_password,
+        location=NYC_POINT,
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
 
-    assert user.location is not None
+    # Read the coordinates back out of the stored geography
+    await db_session.refresh(user, ["latitude", "longitude"])
+    assert user.latitude == 40.730610
+    assert user.longitude == -73.935242
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_event_model_with_venue(db_session):
+async def test_event_model_with_venue(db_session, hashed_password, frozen_now):
     """Test creating an Event model with venue information."""
     # Create user first (required for creator_id)
     user = User(
         name="Event Creator",
         email="creator@example.com",
-        hashed_password=hash_password("testpassword"),
+        hashed_password=hashed_password,
     )
     db_session.add(user)
-    await db_session.commit()
+    await db_session.flush()
 
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
+    start_time = frozen_now + timedelta(days=7)
     end_time = start_time + timedelta(hours=3)
-    location = WKTElement("POINT(-73.935242 40.730610)", srid=4326)
 
     event = Event(
         creator_id=user.id,
@@ -89,7 +92,7 @@ async def test_event_model_with_venue(db_session):
         description="Annual tech conference",
         start_time=start_time,
         end_time=end_time,
-        location=location,
+        location=NYC_POINT,
         venue_name="Convention Center",
         address_line1="123 Main St",
         city="New York",
@@ -100,8 +103,7 @@ async def test_event_model_with_venue(db_session):
         tickets_sold=0,
     )
     db_session.add(event)
-    await db_session.commit()
-    await db_session.refresh(event)
+    await db_session.flush()
 
     assert event.id is not None
     assert event.title == "Tech Conference 2025"
@@ -113,27 +115,26 @@ async def test_event_model_with_venue(db_session):
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_event_location_geospatial_type(db_session):
+async def test_event_location_geospatial_type(db_session, hashed_password, frozen_now):
     """Test that event location is properly stored as geospatial type."""
     # Create user first (required for creator_id)
     user = User(
         name="Event Creator",
         email="creator2@example.com",
-        hashed_password=hash_password("testpassword"),
+        hashed_password=hashed_password,
     )
     db_session.add(user)
-    await db_session.commit()
+    await db_session.flush()
 
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
+    start_time = frozen_now + timedelta(days=7)
     end_time = start_time + timedelta(hours=3)
-    location = WKTElement("POINT(-118.243683 34.052235)", srid=4326)  # LA coordinates
 
     event = Event(
         creator_id=user.id,
         title="LA Event",
         start_time=start_time,
         end_time=end_time,
-        location=location,
+        location=LA_POINT,
         venue_name="LA Venue",
         address_line1="456 Sunset Blvd",
         city="Los Angeles",
@@ -143,34 +144,28 @@ async def test_event_location_geospatial_type(db_session):
         total_tickets=500,
     )
     db_session.add(event)
-    await db_session.commit()
-    await db_session.refresh(event)
+    await db_session.flush()
 
-    assert event.location is not None
-    # The location should be stored and retrievable
+    # The location should be stored and retrievable as a PostGIS point
+    await db_session.refresh(event, ["location"])
+    point = to_shape(event.location)
+    assert (point.x, point.y) == (-118.243683, 34.052235)
 
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_ticket_model_with_relationships(db_session):
-    """Test Ticket model with relationships to User and Event."""
-    # Create user
-    user = User(name="John Doe", email="john@example.com", hashed_password=hash_password("testpassword"))
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)  # Refresh to get ID
+@pytest_asyncio.fixture
+async def user_and_event(db_session, hashed_password, frozen_now) -> tuple[User, Event]:
+    """User and an event they created, inserted with a single flush."""
+    user = User(name="John Doe", email="john@example.com", hashed_password=hashed_password)
 
-    # Create event
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
+    start_time = frozen_now + timedelta(days=7)
     end_time = start_time + timedelta(hours=3)
-    location = WKTElement("POINT(-73.935242 40.730610)", srid=4326)
 
     event = Event(
-        creator_id=user.id,
+        creator=user,
         title="Concert",
         start_time=start_time,
         end_time=end_time,
-        location=location,
+        location=NYC_POINT,
         venue_name="Madison Square Garden",
         address_line1="4 Pennsylvania Plaza",
         city="New York",
@@ -179,11 +174,19 @@ async def test_ticket_model_with_relationships(db_session):
         postal_code="10001",
         total_tickets=100,
     )
-    db_session.add(event)
-    await db_session.commit()
+    db_session.add_all([user, event])
+    await db_session.flush()
+    return user, event
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_ticket_model_with_relationships(db_session, user_and_event, frozen_now):
+    """Test Ticket model with relationships to User and Event."""
+    user, event = user_and_event
 
     # Create ticket
-    expires_at = datetime.now(timezone.utc) + timedelta(minutes=2)
+    expires_at = frozen_now + timedelta(minutes=2)
     ticket = Ticket(
         user_id=user.id,
         event_id=event.id,
@@ -191,8 +194,7 @@ async def test_ticket_model_with_relationships(db_session):
         expires_at=expires_at,
     )
     db_session.add(ticket)
-    await db_session.commit()
-    await db_session.refresh(ticket)
+    await db_session.flush()
 
     assert ticket.id is not None
     assert ticket.user_id == user.id
@@ -204,8 +206,7 @@ async def test_ticket_model_with_relationships(db_session):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_ticket_status_enum_values(db_session):
+def test_ticket_status_enum_values():
     """Test that ticket status enum has correct values."""
     assert TicketStatus.RESERVED == "reserved"
     assert TicketStatus.PAID == "paid"
@@ -214,106 +215,64 @@ async def test_ticket_status_enum_values(db_session):
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_ticket_default_status_is_reserved(db_session):
+async def test_ticket_default_status_is_reserved(db_session, user_and_event):
     """Test that ticket default status is RESERVED."""
-    user = User(name="John Doe", email="john@example.com", hashed_password=hash_password("testpassword"))
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)  # Refresh to get ID
-
-    start_time = datetime.now(timezone.utc) + timedelta(days=7)
-    end_time = start_time + timedelta(hours=3)
-    location = WKTElement("POINT(-73.935242 40.730610)", srid=4326)
-
-    event = Event(
-        creator_id=user.id,
-        title="Concert",
-        start_time=start_time,
-        end_time=end_time,
-        location=location,
-        venue_name="Venue",
-        address_line1="123 St",
-        city="NYC",
-        state="NY",
-        country="USA",
-        postal_code="10001",
-        total_tickets=100,
-    )
-    db_session.add(event)
-    await db_session.commit()
+    user, event = user_and_event
 
     ticket = Ticket(
         user_id=user.id,
         event_id=event.id,
     )
     db_session.add(ticket)
-    await db_session.commit()
-    await db_session.refresh(ticket)
+    await db_session.flush()
 
     assert ticket.status == TicketStatus.RESERVED
 
 
+def read_property(model, name: str, **fields):
+    """Evaluate a model @property on plain attributes, skipping ORM instrumentation."""
+    return getattr(model, name).fget(SimpleNamespace(**fields))
+
+
 @pytest.mark.unit
 def test_event_tickets_available_property():
     """Test event tickets_available property."""
-    event = Event(
-        title="Test Event",
-        total_tickets=100,
-        tickets_sold=30,
-    )
-    assert event.tickets_available == 70
+    assert read_property(Event, "tickets_available", total_tickets=100, tickets_sold=30) == 70
 
 
 @pytest.mark.unit
 def test_event_is_sold_out_property():
     """Test event is_sold_out property."""
-    event_not_sold_out = Event(
-        title="Test Event",
-        total_tickets=100,
-        tickets_sold=50,
-    )
-    assert event_not_sold_out.is_sold_out is False
-
-    event_sold_out = Event(
-        title="Sold Out Event",
-        total_tickets=100,
-        tickets_sold=100,
-    )
-    assert event_sold_out.is_sold_out is True
+    assert read_property(Event, "is_sold_out", total_tickets=100, tickets_sold=50) is False
+    assert read_property(Event, "is_sold_out", total_tickets=100, tickets_sold=100) is True
 
 
 @pytest.mark.unit
 def test_ticket_is_expired_property():
     """Test ticket is_expired property."""
-    past_time = datetime.now(timezone.utc) - timedelta(minutes=5)
-    future_time = datetime.now(timezone.utc) + timedelta(minutes=5)
+    # Fixed instants far from the clock is_expired compares against
+    past_time = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    future_time = datetime(2100, 1, 1, tzinfo=timezone.utc)
 
-    expired_ticket = Ticket(
-        status=TicketStatus.RESERVED,
-        expires_at=past_time,
+    assert (
+        read_property(Ticket, "is_expired", status=TicketStatus.RESERVED, expires_at=past_time)
+        is True
     )
-    assert expired_ticket.is_expired is True
-
-    valid_ticket = Ticket(
-        status=TicketStatus.RESERVED,
-        expires_at=future_time,
+    assert (
+        read_property(Ticket, "is_expired", status=TicketStatus.RESERVED, expires_at=future_time)
+        is False
     )
-    assert valid_ticket.is_expired is False
-
-    paid_ticket = Ticket(
-        status=TicketStatus.PAID,
-        expires_at=past_time,
+    assert (
+        read_property(Ticket, "is_expired", status=TicketStatus.PAID, expires_at=past_time)
+        is False
     )
-    assert paid_ticket.is_expired is False
 
 
 @pytest.mark.unit
 def test_ticket_status_properties():
     """Test ticket status check properties."""
-    reserved_ticket = Ticket(status=TicketStatus.RESERVED)
-    assert reserved_ticket.is_reserved is True
-    assert reserved_ticket.is_paid is False
+    assert read_property(Ticket, "is_reserved", status=TicketStatus.RESERVED) is True
+    assert read_property(Ticket, "is_paid", status=TicketStatus.RESERVED) is False
 
-    paid_ticket = Ticket(status=TicketStatus.PAID)
-    assert paid_ticket.is_paid is True
-    assert paid_ticket.is_reserved is False
+    assert read_property(Ticket, "is_paid", status=TicketStatus.PAID) is True
+    assert read_property(Ticket, "is_reserved", status=TicketStatus.PAID) is False
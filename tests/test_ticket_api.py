@@ -1,6 +1,7 @@
 """Comprehensive tests for Ticket API endpoints."""
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone, timedelta
 
 from app.models.user import User
@@ -8,6 +9,9 @@ from app.models.event import Event
 from app.models.ticket import Ticket, TicketStatus
 
 
+NONEXISTENT_EVENT_ID = "12345678-1234-1234-1234-123456789012"
+
+
 @pytest.mark.asyncio
 class TestReserveTicket:
     """Tests for POST /api/v1/tickets/ (reserve ticket)."""
@@ -42,31 +46,39 @@ class TestReserveTicket:
 
         assert response.status_code == 403  # Forbidden
 
-    async def test_reserve_ticket_sold_out_event(
-        self, async_client: AsyncClient, test_event_sold_out: Event, auth_headers: dict
-    ):
-        """Test reserving ticket for sold out event."""
-        response = await async_client.post(
-            "/api/v1/tickets/",
-            json={"event_id": str(test_event_sold_out.id)},
-            headers=auth_headers,
-        )
-
-        assert response.status_code == 409  # Conflict
-        assert "sold out" in response.json()["detail"].lower()
-
-    async def test_reserve_ticket_nonexistent_event(
-        self, async_client: AsyncClient, auth_headers: dict
+    @pytest.fixture
+    def reservation_event_id(self, request) -> str:
+        """ID of the event named by the indirect parameter, or an unknown UUID for None."""
+        if request.param is None:
+            return NONEXISTENT_EVENT_ID
+        return str(request.getfixturevalue(request.param).id)
+
+    @pytest.mark.parametrize(
+        "reservation_event_id,expected_status,detail",
+        [
+            ("test_event_sold_out", 409, "sold out"),  # Conflict
+            (None, 404, "not found"),  # Not found
+        ],
+        ids=["sold_out_event", "nonexistent_event"],
+        indirect=["reservation_event_id"],
+    )
+    async def test_reserve_ticket_rejected(
+        self,
+        async_client: AsyncClient,
+        reservation_event_id: str,
+        auth_headers: dict,
+        expected_status: int,
+        detail: str,
     ):
-        """Test reserving ticket for non-existent event."""
-        fake_uuid = "12345678-1234-1234-1234-123456789012"
+        """Test that reserving a sold out or missing event is rejected."""
         response = await async_client.post(
             "/api/v1/tickets/",
-            json={"event_id": fake_uuid},
+            json={"event_id": reservation_event_id},
             headers=auth_headers,
         )
 
-        assert response.status_code == 404  # Not found
+        assert response.status_code == expected_status
+        assert detail in response.json()["detail"].lower()
 
     async def test_reserve_multiple_tickets_same_event(
         self, async_client: AsyncClient, test_event: Event, auth_headers: dict
@@ -148,6 +160,25 @@ class TestPayForTicket:
         assert response.status_code == 409  # Conflict
         assert "reserved" in response.json()["detail"].lower()
 
+    async def test_pay_for_expired_ticket(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_ticket: Ticket,
+        auth_headers: dict,
+    ):
+        """Test paying for a reserved ticket whose expires_at has passed."""
+        test_ticket.expires_at = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        await db_session.flush()
+
+        response = await async_client.post(
+            f"/api/v1/tickets/{test_ticket.id}/pay",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 410  # Gone
+        assert "expired" in response.json()["detail"].lower()
+
     async def test_pay_for_nonexistent_ticket(
         self, async_client: AsyncClient, auth_headers: dict
     ):
@@ -319,7 +350,7 @@ class TestTicketExpiration:
         assert data["expires_at"] is not None
 
         # Parse expiration time
-        expires_at = datetime.fromisoformat(data["expires_at"].replace("Z", "+00:00"))
+        expires_at = datetime.fromisoformat(data["expires_at"])
         now = datetime.now(timezone.utc)
 
         # Should expire in the future
@@ -332,18 +363,12 @@ class TestTicketExpiration:
         self, async_client: AsyncClient, test_ticket: Ticket, auth_headers: dict
     ):
         """Test that paid tickets don't have expiration."""
-        # Pay for ticket
-        await async_client.post(
+        # Pay for ticket; the response carries the updated ticket
+        response = await async_client.post(
             f"/api/v1/tickets/{test_ticket.id}/pay",
             headers=auth_headers,
         )
 
-        # Get ticket details
-        response = await async_client.get(
-            f"/api/v1/tickets/{test_ticket.id}",
-            headers=auth_headers,
-        )
-
         data = response.json()
         # Paid tickets might have null expires_at or the original time
         # The important part is they have paid_at
@@ -6,16 +6,25 @@ from app.schemas.ticket import TicketReserve
 from app.models.ticket import TicketStatus
 
 
+EVENT_ID = uuid4()
+
+
 @pytest.mark.unit
-def test_ticket_reserve_schema_validation():
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"event_id": EVENT_ID},
+        {"event_id": str(EVENT_ID)},
+        {"event_id": EVENT_ID, "user_id": uuid4()},  # User comes from the token, not the body
+    ],
+    ids=["uuid", "uuid_string", "ignores_user_id"],
+)
+def test_ticket_reserve_schema_validation(payload):
     """Test that TicketReserve schema validates correct data."""
-    event_id = uuid4()
-
-    reservation = TicketReserve(
-        event_id=event_id,
-    )
+    reservation = TicketReserve(**payload)
 
-    assert reservation.event_id == event_id
+    assert reservation.event_id == EVENT_ID
+    assert reservation.model_dump() == {"event_id": EVENT_ID}
 
 
 @pytest.mark.unit
@@ -0,0 +1,71 @@
+"""Tests for ticket service layer."""
+from unittest.mock import patch
+
+import pytest
+from kombu.exceptions import OperationalError
+
+from app.models.ticket import TicketStatus
+from app.services.ticket_service import TicketService
+from app.tasks.ticket_tasks import revoke_expiration_task
+
+
+EXPIRATION_TASK_ID = "expire-ticket-task-id"
+
+
+@pytest.fixture
+def service(db_session):
+    """TicketService bound to this test's database session."""
+    return TicketService(db_session)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestMarkTicketPaidRevokesExpiration:
+    """Tests that paying for a ticket cancels its scheduled expiration task."""
+
+    @pytest.fixture(autouse=True)
+    def celery_available(self):
+        """Take the Celery branch of mark_ticket_paid regardless of the local install."""
+        with patch("app.services.ticket_service.CELERY_AVAILABLE", True):
+            yield
+
+    async def test_revokes_expiration_task(self, db_session, service, test_ticket):
+        """Test that the ticket's expiration task is revoked once it is paid."""
+        test_ticket.expiration_task_id = EXPIRATION_TASK_ID
+        await db_session.flush()
+
+        with patch("app.services.ticket_service.revoke_expiration_task") as revoke:
+            result = await service.mark_ticket_paid(test_ticket.id)
+
+        revoke.assert_called_once_with(EXPIRATION_TASK_ID)
+        assert result.status == TicketStatus.PAID
+
+    async def test_broker_error_does_not_fail_payment(self, db_session, service, test_ticket):
+        """Test that an unreachable broker still leaves the ticket paid."""
+        test_ticket.expiration_task_id = EXPIRATION_TASK_ID
+        await db_session.flush()
+
+        with patch(
+            "app.services.ticket_service.revoke_expiration_task",
+            side_effect=OperationalError("broker unreachable"),
+        ):
+            result = await service.mark_ticket_paid(test_ticket.id)
+
+        assert result.status == TicketStatus.PAID
+        assert result.paid_at is not None
+
+    async def test_skips_revoke_without_task_id(self, service, test_ticket):
+        """Test that tickets without a scheduled task do not touch the broker."""
+        with patch("app.services.ticket_service.revoke_expiration_task") as revoke:
+            await service.mark_ticket_paid(test_ticket.id)
+
+        revoke.assert_not_called()
+
+
+@pytest.mark.unit
+def test_revoke_expiration_task_does_not_terminate():
+    """Test that revoking only drops the queued task instead of signalling workers."""
+    with patch("app.tasks.ticket_tasks.celery_app") as celery_app:
+        revoke_expiration_task(EXPIRATION_TASK_ID)
+
+    celery_app.control.revoke.assert_called_once_with(EXPIRATION_TASK_ID)
@@ -0,0 +1,82 @@
+"""Tests for ticket Celery tasks."""
+import functools
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.models.ticket import Ticket, TicketStatus
+from app.tasks.ticket_tasks import _cleanup_expired_tickets_async
+
+
+# Fixed instants far on either side of the database clock
+PAST = datetime(2000, 1, 1, tzinfo=timezone.utc)
+FUTURE = datetime(2100, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def task_db(db_session, db_connection, session_factory):
+    """Run the tasks' sessions on this test's connection, inside its rolled-back transaction."""
+    with patch(
+        "app.tasks.ticket_tasks.create_async_db_session",
+        return_value=(AsyncMock(), functools.partial(session_factory, bind=db_connection)),
+    ):
+        yield
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_cleanup_expires_only_lapsed_reservations(
+    db_session, task_db, test_user, test_event
+):
+    """Test that cleanup expires lapsed reserved tickets and releases their seats."""
+    expired = [
+        Ticket(
+            user_id=test_user.id,
+            event_id=test_event.id,
+            status=TicketStatus.RESERVED,
+            expires_at=PAST,
+        )
+        for _ in range(2)
+    ]
+    unexpired = Ticket(
+        user_id=test_user.id,
+        event_id=test_event.id,
+        status=TicketStatus.RESERVED,
+        expires_at=FUTURE,
+    )
+    paid = Ticket(
+        user_id=test_user.id,
+        event_id=test_event.id,
+        status=TicketStatus.PAID,
+        expires_at=PAST,
+        paid_at=PAST,
+    )
+    db_session.add_all([*expired, unexpired, paid])
+    test_event.tickets_sold = 4
+    await db_session.flush()
+
+    result = await _cleanup_expired_tickets_async()
+
+    assert result == {"status": "success", "expired_count": 2, "event_count": 1}
+
+    for ticket in [*expired, unexpired, paid]:
+        await db_session.refresh(ticket, ["status"])
+    await db_session.refresh(test_event, ["tickets_sold"])
+
+    assert [ticket.status for ticket in expired] == [TicketStatus.EXPIRED] * 2
+    assert unexpired.status == TicketStatus.RESERVED
+    assert paid.status == TicketStatus.PAID
+    assert test_event.tickets_sold == 2
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_cleanup_without_lapsed_reservations(db_session, task_db, test_ticket):
+    """Test that cleanup is a no-op when no reservation has lapsed."""
+    result = await _cleanup_expired_tickets_async()
+
+    assert result == {"status": "success", "expired_count": 0}
+
+    await db_session.refresh(test_ticket, ["status"])
+    assert test_ticket.status == TicketStatus.RESERVED